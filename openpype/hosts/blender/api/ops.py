@@ -438,7 +438,8 @@ def register():
     pcoll.load("pyblish_menu_icon", str(pyblish_icon_file.absolute()), 'IMAGE')
     PREVIEW_COLLECTIONS["avalon"] = pcoll
 
-    BlenderApplication.get_app()
+    # The Qt application is created on first use by `LaunchQtApp` (or when a
+    # message window is shown), not at startup.
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.TOPBAR_MT_editor_menus.append(draw_avalon_menu)
@@ -1,7 +1,9 @@
+import math
 import os
 import sys
+import time
 import traceback
-from typing import Callable, Dict, Iterator, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import bpy
 
@@ -10,7 +12,6 @@ from . import ops
 
 import pyblish.api
 
-from openpype.client import get_asset_by_name
 from openpype.pipeline import (
     schema,
     legacy_io,
@@ -28,7 +29,6 @@ from openpype.lib import (
     emit_event
 )
 import openpype.hosts.blender
-from openpype.settings import get_project_settings
 
 
 HOST_DIR = os.path.dirname(os.path.abspath(openpype.hosts.blender.__file__))
@@ -44,6 +44,19 @@ AVALON_CONTAINERS = "AVALON_CONTAINERS"
 AVALON_PROPERTY = 'avalon'
 IS_HEADLESS = bpy.app.background
 
+# Project settings resolved by file events, keyed by project name and stored
+# as `(timestamp, settings)` so they are reused for `PROJECT_SETTINGS_TTL`
+# seconds.
+PROJECT_SETTINGS_TTL = 60
+_PROJECT_SETTINGS_CACHE: Dict[str, Tuple[float, Dict]] = {}
+
+# Asset documents queried by file events, keyed by `(project, asset)`.
+ASSET_DOC_TTL = 30
+_ASSET_DOC_CACHE: Dict[Tuple[str, str], Tuple[float, Optional[Dict]]] = {}
+
+# AVALON_CONTAINERS collection per scene name, cleared on file load.
+_AVALON_CONTAINER_CACHE: Dict[str, bpy.types.Collection] = {}
+
 log = Logger.get_logger(__name__)
 
 
@@ -113,15 +126,82 @@ def message_window(title, message):
     _process_app_events()
 
 
-def get_asset_data():
-    project_name = get_current_project_name()
-    asset_name = get_current_asset_name()
+def _cached_project_settings(
+    project_name: str, ttl: float = PROJECT_SETTINGS_TTL
+) -> Dict:
+    """Return project settings, reusing a recently resolved value.
+
+    When resolving the settings fails, the last known value is returned
+    instead so file events keep working offline.
+    """
+    from openpype.settings import get_project_settings
+
+    cached = _PROJECT_SETTINGS_CACHE.get(project_name)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
+    try:
+        settings = get_project_settings(project_name)
+    except Exception:
+        if cached is None:
+            raise
+        log.warning(
+            "Failed to resolve project settings, using cached values.",
+            exc_info=True
+        )
+        return cached[1]
+
+    _PROJECT_SETTINGS_CACHE[project_name] = (now, settings)
+    return settings
+
+
+def _get_asset_doc_cached(
+    project_name: str, asset_name: str, ttl: float = ASSET_DOC_TTL
+) -> Optional[Dict]:
+    """Return the asset document, reusing a recently queried one."""
+    from openpype.client import get_asset_by_name
+
+    key = (project_name, asset_name)
+    cached = _ASSET_DOC_CACHE.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
     asset_doc = get_asset_by_name(project_name, asset_name)
+    _ASSET_DOC_CACHE[key] = (now, asset_doc)
+    return asset_doc
+
+
+def get_asset_data(
+    project_name: Optional[str] = None,
+    asset_name: Optional[str] = None,
+    use_cache: bool = False
+) -> Optional[Dict]:
+    """Return the data of the asset document.
+
+    With `use_cache` a document queried in the last `ASSET_DOC_TTL` seconds
+    is reused. That is meant for file events only, explicit user actions
+    should always see the current values from the database.
+    """
+    from openpype.client import get_asset_by_name
+
+    project_name = project_name or get_current_project_name()
+    asset_name = asset_name or get_current_asset_name()
+    if use_cache:
+        asset_doc = _get_asset_doc_cached(project_name, asset_name)
+    else:
+        asset_doc = get_asset_by_name(project_name, asset_name)
+    if not asset_doc:
+        return None
 
     return asset_doc.get("data")
 
 
 def set_frame_range(data):
+    if not data:
+        return
+
     scene = bpy.context.scene
 
     # Default scene settings
@@ -129,9 +209,6 @@ def set_frame_range(data):
     frameEnd = scene.frame_end
     fps = scene.render.fps / scene.render.fps_base
 
-    if not data:
-        return
-
     if data.get("frameStart"):
         frameStart = data.get("frameStart")
     if data.get("frameEnd"):
@@ -139,22 +216,33 @@ def set_frame_range(data):
     if data.get("fps"):
         fps = data.get("fps")
 
-    scene.frame_start = frameStart
-    scene.frame_end = frameEnd
-    scene.render.fps = round(fps)
-    scene.render.fps_base = round(fps) / fps
+    # Only write changed values to avoid needless depsgraph and UI updates
+    if scene.frame_start != frameStart:
+        scene.frame_start = frameStart
+    if scene.frame_end != frameEnd:
+        scene.frame_end = frameEnd
+
+    render = scene.render
+    fps_rounded = round(fps)
+    fps_base = fps_rounded / fps
+    if render.fps != fps_rounded:
+        render.fps = fps_rounded
+    # `fps_base` is stored as a single precision float, an exact comparison
+    # would never match fractional rates like 23.976.
+    if not math.isclose(render.fps_base, fps_base, rel_tol=1e-6):
+        render.fps_base = fps_base
 
 
 def set_resolution(data):
+    if not data:
+        return
+
     scene = bpy.context.scene
 
     # Default scene settings
     resolution_x = scene.render.resolution_x
     resolution_y = scene.render.resolution_y
 
-    if not data:
-        return
-
     if data.get("resolutionWidth"):
         resolution_x = data.get("resolutionWidth")
     if data.get("resolutionHeight"):
@@ -165,13 +253,13 @@ def set_resolution(data):
 
 
 def on_new():
-    project = os.environ.get("AVALON_PROJECT")
-    settings = get_project_settings(project).get("blender")
+    project_name = get_current_project_name()
+    settings = _cached_project_settings(project_name).get("blender")
 
     set_resolution_startup = settings.get("set_resolution_startup")
     set_frames_startup = settings.get("set_frames_startup")
 
-    data = get_asset_data()
+    data = get_asset_data(project_name, use_cache=True)
 
     if set_resolution_startup:
         set_resolution(data)
@@ -186,13 +274,13 @@ def on_new():
 
 
 def on_open():
-    project = os.environ.get("AVALON_PROJECT")
-    settings = get_project_settings(project).get("blender")
+    project_name = get_current_project_name()
+    settings = _cached_project_settings(project_name).get("blender")
 
     set_resolution_startup = settings.get("set_resolution_startup")
     set_frames_startup = settings.get("set_frames_startup")
 
-    data = get_asset_data()
+    data = get_asset_data(project_name, use_cache=True)
 
     if set_resolution_startup:
         set_resolution(data)
@@ -226,6 +314,10 @@ def _on_save_post(*args):
 
 @bpy.app.handlers.persistent
 def _on_load_post(*args):
+    # Drop collections of the previous file before any open/new callback
+    # can look up the container.
+    _AVALON_CONTAINER_CACHE.clear()
+
     # Detect new file or opening an existing file
     if bpy.data.filepath:
         # Likely this was an open operation since it has a filepath
@@ -238,24 +330,20 @@ def _on_load_post(*args):
 
 def _register_callbacks():
     """Register callbacks for certain events."""
-    def _remove_handler(handlers: List, callback: Callable):
-        """Remove the callback from the given handler list."""
-
-        try:
-            handlers.remove(callback)
-        except ValueError:
-            pass
+    callbacks = (
+        (bpy.app.handlers.save_pre, _on_save_pre),
+        (bpy.app.handlers.save_post, _on_save_post),
+        (bpy.app.handlers.load_post, _on_load_post),
+    )
 
     # TODO (jasper): implement on_init callback?
 
-    # Be sure to remove existig ones first.
-    _remove_handler(bpy.app.handlers.save_pre, _on_save_pre)
-    _remove_handler(bpy.app.handlers.save_post, _on_save_post)
-    _remove_handler(bpy.app.handlers.load_post, _on_load_post)
-
-    bpy.app.handlers.save_pre.append(_on_save_pre)
-    bpy.app.handlers.save_post.append(_on_save_post)
-    bpy.app.handlers.load_post.append(_on_load_post)
+    # Be sure to remove existig ones first, then register them again.
+    for handlers, callback in callbacks:
+        handlers[:] = [
+            handler for handler in handlers if handler is not callback
+        ]
+        handlers.append(callback)
 
     log.info("Installed event handler _on_save_pre...")
     log.info("Installed event handler _on_save_post...")
@@ -275,6 +363,9 @@ def _on_task_changed():
     workdir = legacy_io.Session["AVALON_WORKDIR"]
     log.debug("New working directory: %s", workdir)
 
+    _PROJECT_SETTINGS_CACHE.clear()
+    _ASSET_DOC_CACHE.clear()
+
 
 def _register_events():
     """Install callbacks for specific events."""
@@ -300,8 +391,20 @@ def _discover_gui() -> Optional[Callable]:
     return None
 
 
-def add_to_avalon_container(container: bpy.types.Collection):
-    """Add the container to the Avalon container."""
+def _get_avalon_container() -> bpy.types.Collection:
+    """Return the Avalon container collection, creating it when missing.
+
+    The collection is cached per scene; the cache is cleared on file load.
+    """
+    scene = bpy.context.scene
+    avalon_container = _AVALON_CONTAINER_CACHE.get(scene.name)
+    if avalon_container is not None:
+        try:
+            if avalon_container.name == AVALON_CONTAINERS:
+                return avalon_container
+        except ReferenceError:
+            # The collection was removed since it was cached.
+            pass
 
     avalon_container = bpy.data.collections.get(AVALON_CONTAINERS)
     if not avalon_container:
@@ -311,15 +414,25 @@ def add_to_avalon_container(container: bpy.types.Collection):
         # and can be managed easily. Otherwise it's only found in "Blender
         # File" view and it will be removed by Blenders garbage collection,
         # unless you set a 'fake user'.
-        bpy.context.scene.collection.children.link(avalon_container)
-
-    avalon_container.children.link(container)
+        scene.collection.children.link(avalon_container)
 
     # Disable Avalon containers for the view layers.
-    for view_layer in bpy.context.scene.view_layers:
-        for child in view_layer.layer_collection.children:
-            if child.collection == avalon_container:
-                child.exclude = True
+    for view_layer in scene.view_layers:
+        layer_collection = view_layer.layer_collection.children.get(
+            avalon_container.name
+        )
+        if layer_collection:
+            layer_collection.exclude = True
+
+    _AVALON_CONTAINER_CACHE[scene.name] = avalon_container
+    return avalon_container
+
+
+def add_to_avalon_container(container: bpy.types.Collection):
+    """Add the container to the Avalon container."""
+
+    avalon_container = _get_avalon_container()
+    avalon_container.children.link(container)
 
 
 def metadata_update(node: bpy.types.bpy_struct_meta_idprop, data: Dict):
@@ -328,12 +441,15 @@ def metadata_update(node: bpy.types.bpy_struct_meta_idprop, data: Dict):
     Existing metadata will be updated.
     """
 
-    if not node.get(AVALON_PROPERTY):
-        node[AVALON_PROPERTY] = dict()
+    metadata = node.get(AVALON_PROPERTY)
+    metadata = metadata.to_dict() if metadata else dict()
     for key, value in data.items():
         if value is None:
             continue
-        node[AVALON_PROPERTY][key] = value
+        metadata[key] = value
+
+    # Write the ID property once instead of once per key
+    node[AVALON_PROPERTY] = metadata
 
 
 def containerise(name: str,
@@ -367,8 +483,9 @@ def containerise(name: str,
         node_name = f"{node_name}_{suffix}"
     container = bpy.data.collections.new(name=node_name)
     # Link the children nodes
+    link_object = container.objects.link
     for obj in nodes:
-        container.objects.link(obj)
+        link_object(obj)
 
     data = {
         "schema": "openpype:container-2.0",
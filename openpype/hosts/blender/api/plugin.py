@@ -1,7 +1,9 @@
 """Shared functionality for pipeline plugins for Blender."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import bpy
 
@@ -19,7 +21,10 @@ from .lib import (
     get_selection
 )
 
-VALID_EXTENSIONS = [".blend", ".json", ".abc", ".fbx"]
+VALID_EXTENSIONS = frozenset({".blend", ".json", ".abc", ".fbx"})
+
+# Last 3D viewport found by `create_blender_context`.
+_VIEW_3D_REGION_CACHE = {}
 
 
 def asset_name(
@@ -40,15 +45,59 @@ def get_unique_number(
     avalon_container = bpy.data.collections.get(AVALON_CONTAINERS)
     if not avalon_container:
         return "01"
-    asset_groups = avalon_container.all_objects
 
-    container_names = [c.name for c in asset_groups if c.type == 'EMPTY']
-    count = 1
-    name = f"{asset}_{count:0>2}_{subset}"
-    while name in container_names:
-        count += 1
-        name = f"{asset}_{count:0>2}_{subset}"
-    return f"{count:0>2}"
+    # Find the highest number in use in a single pass over the containers
+    # instead of probing every candidate name against all of them.
+    prefix = f"{asset}_"
+    suffix = f"_{subset}"
+    min_length = len(prefix) + len(suffix)
+    count = 0
+    for obj in avalon_container.all_objects:
+        if obj.type != 'EMPTY':
+            continue
+        name = obj.name
+        if (
+            len(name) <= min_length
+            or not name.startswith(prefix)
+            or not name.endswith(suffix)
+        ):
+            continue
+        number = name[len(prefix):-len(suffix)]
+        if number.isdigit():
+            count = max(count, int(number))
+
+    return f"{count + 1:0>2}"
+
+
+@lru_cache(maxsize=1024)
+def _normalize_libpath(libpath: str, blend_filepath: str) -> str:
+    # `blend_filepath` is only part of the cache key, relative paths are
+    # resolved against the current blend file by `bpy.path.abspath`.
+    return os.path.normcase(
+        os.path.normpath(os.path.abspath(bpy.path.abspath(libpath)))
+    )
+
+
+def normalize_libpath(libpath: str) -> str:
+    """Return the absolute, normalized form of a library path.
+
+    The path is normalized as a string only, without touching the file
+    system, and results are cached per open blend file.
+    """
+    return _normalize_libpath(str(libpath), bpy.data.filepath)
+
+
+def get_children_map() -> Dict[bpy.types.Object, List[bpy.types.Object]]:
+    """Return the direct children of every parent object in the file.
+
+    `Object.children` scans all objects of the file on every access, so a
+    traversal over many objects should build this map once instead.
+    """
+    children_map = {}
+    for obj in bpy.data.objects:
+        if obj.parent:
+            children_map.setdefault(obj.parent, []).append(obj)
+    return children_map
 
 
 def prepare_data(data, container_name=None):
@@ -71,24 +120,55 @@ def create_blender_context(active: Optional[bpy.types.Object] = None,
     if not isinstance(selected, list):
         selected = [selected]
 
-    override_context = bpy.context.copy()
-
-    windows = [window] if window else bpy.context.window_manager.windows
+    view_3d = _get_view_3d_region(window)
+    if view_3d is None:
+        raise Exception("Could not create a custom Blender context.")
 
-    for win in windows:
+    win, area, region = view_3d
+    override_context = bpy.context.copy()
+    override_context['window'] = win
+    override_context['screen'] = win.screen
+    override_context['area'] = area
+    override_context['region'] = region
+    override_context['scene'] = bpy.context.scene
+    override_context['active_object'] = active
+    override_context['selected_objects'] = selected
+    return override_context
+
+
+def _get_view_3d_region(
+    window: Optional[bpy.types.Window] = None
+) -> Optional[Tuple]:
+    """Return `(window, area, region)` of the first 3D viewport found.
+
+    The last result is reused while its window, area and region still exist
+    and the area is still a 3D viewport.
+    """
+    windows = bpy.context.window_manager.windows
+    cached = _VIEW_3D_REGION_CACHE.get("region")
+    if cached is not None and (window is None or cached[0] == window):
+        win, area, region = cached
+        # Membership is tested first, so stale references are never
+        # accessed after the UI was reloaded.
+        if (
+            win in windows.values()
+            and area in win.screen.areas.values()
+            and area.type == 'VIEW_3D'
+            and region in area.regions.values()
+        ):
+            return cached
+
+    for win in ([window] if window else windows):
         for area in win.screen.areas:
-            if area.type == 'VIEW_3D':
-                for region in area.regions:
-                    if region.type == 'WINDOW':
-                        override_context['window'] = win
-                        override_context['screen'] = win.screen
-                        override_context['area'] = area
-                        override_context['region'] = region
-                        override_context['scene'] = bpy.context.scene
-                        override_context['active_object'] = active
-                        override_context['selected_objects'] = selected
-                        return override_context
-    raise Exception("Could not create a custom Blender context.")
+            if area.type != 'VIEW_3D':
+                continue
+            for region in area.regions:
+                if region.type == 'WINDOW':
+                    view_3d = (win, area, region)
+                    _VIEW_3D_REGION_CACHE["region"] = view_3d
+                    return view_3d
+
+    return None
 
 
 def get_parent_collection(collection):
@@ -96,42 +176,32 @@ def get_parent_collection(collection):
     check_list = [bpy.context.scene.collection]
 
     for c in check_list:
-        if collection.name in c.children.keys():
+        children = c.children
+        # Test the name against the collection itself, `.keys()` would
+        # build a list of all child names for every visited collection.
+        if collection.name in children:
             return c
-        check_list.extend(c.children)
+        check_list.extend(children)
 
     return None
 
 
 def get_local_collection_with_name(name):
-    for collection in bpy.data.collections:
-        if collection.name == name and collection.library is None:
-            return collection
-    return None
+    # A `(name, None)` key looks up the local (not linked) collection
+    # directly instead of scanning all collections.
+    return bpy.data.collections.get((name, None))
 
 
 def deselect_all():
     """Deselect all objects in the scene.
 
-    Blender gives context error if trying to deselect object that it isn't
-    in object mode.
+    The selection state is written directly instead of running the
+    `select_all` operator, which needs every object in object mode and so
+    required switching modes back and forth.
     """
-    modes = []
-    active = bpy.context.view_layer.objects.active
-
-    for obj in bpy.data.objects:
-        if obj.mode != 'OBJECT':
-            modes.append((obj, obj.mode))
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-    bpy.ops.object.select_all(action='DESELECT')
-
-    for p in modes:
-        bpy.context.view_layer.objects.active = p[0]
-        bpy.ops.object.mode_set(mode=p[1])
-
-    bpy.context.view_layer.objects.active = active
+    for obj in bpy.context.view_layer.objects:
+        if obj.select_get():
+            obj.select_set(False)
 
 
 class Creator(LegacyCreator):
@@ -200,15 +270,18 @@ class AssetLoader(LoaderPlugin):
         """
         assert not container.children, "Nested collections are not supported."
         assert container.objects, "The collection doesn't contain any objects."
-        libraries = set()
+        library = None
         for obj in container.objects:
             assert obj.library, f"'{obj.name}' is not linked."
-            libraries.add(obj.library)
-
-        assert len(
-            libraries) == 1, "'{container.name}' contains objects from more then 1 library."
-
-        return list(libraries)[0]
+            if library is None:
+                library = obj.library
+            # Stop at the first object from another library.
+            assert obj.library == library, (
+                f"'{container.name}' contains objects from more then 1 "
+                "library."
+            )
+
+        return library
 
     def process_asset(self,
                       context: dict,
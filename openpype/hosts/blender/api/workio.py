@@ -1,5 +1,6 @@
 """Host API required for Work Files."""
 
+import os
 from pathlib import Path
 from typing import List, Optional
 
@@ -62,7 +63,7 @@ def current_file() -> Optional[str]:
     """Return the path of the open scene file."""
 
     current_filepath = bpy.data.filepath
-    if Path(current_filepath).is_file():
+    if os.path.isfile(current_filepath):
         return current_filepath
     return None
 
@@ -42,8 +42,9 @@ class CreateCamera(plugin.Creator):
         if (self.options or {}).get("useSelection"):
             bpy.context.view_layer.objects.active = asset_group
             selected = lib.get_selection()
+            selected_set = set(selected)
             for obj in selected:
-                if obj.parent in selected:
+                if obj.parent in selected_set:
                     obj.select_set(False)
                     continue
             selected.append(asset_group)
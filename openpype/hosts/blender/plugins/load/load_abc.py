@@ -34,7 +34,8 @@ class CacheModelLoader(plugin.AssetLoader):
     color = "orange"
 
     def _remove(self, asset_group):
-        objects = list(asset_group.children)
+        children_map = plugin.get_children_map()
+        objects = list(children_map.get(asset_group, []))
         empties = []
 
         for obj in objects:
@@ -43,7 +44,7 @@ class CacheModelLoader(plugin.AssetLoader):
                     bpy.data.materials.remove(material_slot.material)
                 bpy.data.meshes.remove(obj.data)
             elif obj.type == 'EMPTY':
-                objects.extend(obj.children)
+                objects.extend(children_map.get(obj, []))
                 empties.append(obj)
 
         for empty in empties:
@@ -73,20 +74,22 @@ class CacheModelLoader(plugin.AssetLoader):
 
         objects.reverse()
 
+        prefix = f"{group_name}:"
+        # Data and materials can be shared by several objects, collect them
+        # first so each one is renamed only once.
+        datablocks = {}
         for obj in objects:
             # Unlink the object from all collections
             collections = obj.users_collection
             for collection in collections:
                 collection.objects.unlink(obj)
-            name = obj.name
-            obj.name = f"{group_name}:{name}"
+            obj.name = prefix + obj.name
             if obj.type != 'EMPTY':
-                name_data = obj.data.name
-                obj.data.name = f"{group_name}:{name_data}"
+                datablocks[obj.data] = None
 
                 for material_slot in obj.material_slots:
-                    name_mat = material_slot.material.name
-                    material_slot.material.name = f"{group_name}:{name_mat}"
+                    if material_slot.material:
+                        datablocks[material_slot.material] = None
 
             if not obj.get(AVALON_PROPERTY):
                 obj[AVALON_PROPERTY] = {}
@@ -94,6 +97,9 @@ class CacheModelLoader(plugin.AssetLoader):
             avalon_info = obj[AVALON_PROPERTY]
             avalon_info.update({"container_name": group_name})
 
+        for datablock in datablocks:
+            datablock.name = prefix + datablock.name
+
         plugin.deselect_all()
 
         return objects
@@ -204,10 +210,10 @@ class CacheModelLoader(plugin.AssetLoader):
         group_libpath = metadata["libpath"]
 
         normalized_group_libpath = (
-            str(Path(bpy.path.abspath(group_libpath)).resolve())
+            plugin.normalize_libpath(group_libpath)
         )
         normalized_libpath = (
-            str(Path(bpy.path.abspath(str(libpath))).resolve())
+            plugin.normalize_libpath(str(libpath))
         )
         self.log.debug(
             "normalized_group_libpath:\n  %s\nnormalized_libpath:\n  %s",
@@ -107,7 +107,7 @@ class BlendActionLoader(openpype.hosts.blender.api.plugin.AssetLoader):
         # Save the list of objects in the metadata container
         container_metadata["objects"] = objects_list
 
-        bpy.ops.object.select_all(action='DESELECT')
+        openpype.hosts.blender.api.plugin.deselect_all()
 
         nodes = list(container.objects)
         nodes.append(container)
@@ -160,10 +160,11 @@ class BlendActionLoader(openpype.hosts.blender.api.plugin.AssetLoader):
 
         collection_libpath = collection_metadata["libpath"]
         normalized_collection_libpath = (
-            str(Path(bpy.path.abspath(collection_libpath)).resolve())
+            openpype.hosts.blender.api.plugin.normalize_libpath(
+                collection_libpath)
         )
         normalized_libpath = (
-            str(Path(bpy.path.abspath(str(libpath))).resolve())
+            openpype.hosts.blender.api.plugin.normalize_libpath(str(libpath))
         )
         logger.debug(
             "normalized_collection_libpath:\n  %s\nnormalized_libpath:\n  %s",
@@ -176,19 +177,28 @@ class BlendActionLoader(openpype.hosts.blender.api.plugin.AssetLoader):
 
         strips = []
 
+        # Only armatures with animation data can hold strips using the
+        # action, collect their NLA tracks once for all objects. The
+        # container objects are removed in the loop below, so tracks they
+        # own must not be kept around.
+        container_objects = set(collection_metadata["objects"])
+        nla_tracks = [
+            track
+            for arm in bpy.data.objects
+            if arm.type == 'ARMATURE' and arm.animation_data is not None
+            and arm not in container_objects
+            for track in arm.animation_data.nla_tracks
+        ]
+
         for obj in list(collection_metadata["objects"]):
             # Get all the strips that use the action
-            arm_objs = [
-                arm for arm in bpy.data.objects if arm.type == 'ARMATURE']
-
-            for armature_obj in arm_objs:
-                if armature_obj.animation_data is not None:
-                    for track in armature_obj.animation_data.nla_tracks:
-                        for strip in track.strips:
-                            if strip.action == obj.animation_data.action:
-                                strips.append(strip)
+            action = obj.animation_data.action
+            for track in nla_tracks:
+                for strip in track.strips:
+                    if strip.action == action:
+                        strips.append(strip)
 
-            bpy.data.actions.remove(obj.animation_data.action)
+            bpy.data.actions.remove(action)
             bpy.data.objects.remove(obj)
 
         lib_container = collection_metadata["lib_container"]
@@ -243,7 +253,7 @@ class BlendActionLoader(openpype.hosts.blender.api.plugin.AssetLoader):
         collection_metadata["libpath"] = str(libpath)
         collection_metadata["representation"] = str(representation["_id"])
 
-        bpy.ops.object.select_all(action='DESELECT')
+        openpype.hosts.blender.api.plugin.deselect_all()
 
     def remove(self, container: Dict) -> bool:
         """Remove an existing container from a Blender scene.
@@ -272,19 +282,28 @@ class BlendActionLoader(openpype.hosts.blender.api.plugin.AssetLoader):
         objects = collection_metadata["objects"]
         lib_container = collection_metadata["lib_container"]
 
+        # Only armatures with animation data can hold strips using the
+        # action, collect their NLA tracks once for all objects. The
+        # container objects are removed in the loop below, so tracks they
+        # own must not be kept around.
+        container_objects = set(objects)
+        nla_tracks = [
+            track
+            for arm in bpy.data.objects
+            if arm.type == 'ARMATURE' and arm.animation_data is not None
+            and arm not in container_objects
+            for track in arm.animation_data.nla_tracks
+        ]
+
         for obj in list(objects):
             # Get all the strips that use the action
-            arm_objs = [
-                arm for arm in bpy.data.objects if arm.type == 'ARMATURE']
-
-            for armature_obj in arm_objs:
-                if armature_obj.animation_data is not None:
-                    for track in armature_obj.animation_data.nla_tracks:
-                        for strip in track.strips:
-                            if strip.action == obj.animation_data.action:
-                                track.strips.remove(strip)
+            action = obj.animation_data.action
+            for track in nla_tracks:
+                for strip in track.strips:
+                    if strip.action == action:
+                        track.strips.remove(strip)
 
-            bpy.data.actions.remove(obj.animation_data.action)
+            bpy.data.actions.remove(action)
             bpy.data.objects.remove(obj)
 
         bpy.data.collections.remove(bpy.data.collections[lib_container])
@@ -126,10 +126,10 @@ class AudioLoader(plugin.AssetLoader):
         group_libpath = metadata["libpath"]
 
         normalized_group_libpath = (
-            str(Path(bpy.path.abspath(group_libpath)).resolve())
+            plugin.normalize_libpath(group_libpath)
         )
         normalized_libpath = (
-            str(Path(bpy.path.abspath(str(libpath))).resolve())
+            plugin.normalize_libpath(str(libpath))
         )
         self.log.debug(
             "normalized_group_libpath:\n  %s\nnormalized_libpath:\n  %s",
@@ -29,11 +29,9 @@ class BlendLoader(plugin.AssetLoader):
 
     @staticmethod
     def _get_asset_container(objects):
-        empties = [obj for obj in objects if obj.type == 'EMPTY']
-
-        for empty in empties:
-            if empty.get(AVALON_PROPERTY):
-                return empty
+        for obj in objects:
+            if obj.type == 'EMPTY' and obj.get(AVALON_PROPERTY):
+                return obj
 
         return None
 
@@ -237,21 +235,24 @@ class BlendLoader(plugin.AssetLoader):
         ]
 
         members = asset_group.get(AVALON_PROPERTY).get("members", [])
+        members_set = set(members)
 
         # We need to update all the parent container members
         parent_containers = self.get_all_container_parents(asset_group)
 
         for parent in parent_containers:
             parent.get(AVALON_PROPERTY)["members"] = list(filter(
-                lambda i: i not in members,
+                lambda i: i not in members_set,
                 parent.get(AVALON_PROPERTY).get("members", [])))
 
         for attr in attrs:
-            for data in getattr(bpy.data, attr):
-                if data in members:
-                    # Skip the asset group
-                    if data == asset_group:
-                        continue
-                    getattr(bpy.data, attr).remove(data)
+            data_collection = getattr(bpy.data, attr)
+            to_remove = [
+                data for data in data_collection
+                # Skip the asset group
+                if data in members_set and data != asset_group
+            ]
+            for data in to_remove:
+                data_collection.remove(data)
 
         bpy.data.objects.remove(asset_group)
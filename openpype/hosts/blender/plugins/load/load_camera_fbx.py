@@ -31,13 +31,14 @@ class FbxCameraLoader(plugin.AssetLoader):
     color = "orange"
 
     def _remove(self, asset_group):
-        objects = list(asset_group.children)
+        children_map = plugin.get_children_map()
+        objects = list(children_map.get(asset_group, []))
 
         for obj in objects:
             if obj.type == 'CAMERA':
                 bpy.data.cameras.remove(obj.data)
             elif obj.type == 'EMPTY':
-                objects.extend(obj.children)
+                objects.extend(children_map.get(obj, []))
                 bpy.data.objects.remove(obj)
 
     def _process(self, libpath, asset_group, group_name):
@@ -171,10 +172,10 @@ class FbxCameraLoader(plugin.AssetLoader):
         group_libpath = metadata["libpath"]
 
         normalized_group_libpath = (
-            str(Path(bpy.path.abspath(group_libpath)).resolve())
+            plugin.normalize_libpath(group_libpath)
         )
         normalized_libpath = (
-            str(Path(bpy.path.abspath(str(libpath))).resolve())
+            plugin.normalize_libpath(str(libpath))
         )
         self.log.debug(
             "normalized_group_libpath:\n  %s\nnormalized_libpath:\n  %s",
@@ -31,7 +31,8 @@ class FbxModelLoader(plugin.AssetLoader):
     color = "orange"
 
     def _remove(self, asset_group):
-        objects = list(asset_group.children)
+        children_map = plugin.get_children_map()
+        objects = list(children_map.get(asset_group, []))
 
         for obj in objects:
             if obj.type == 'MESH':
@@ -40,12 +41,12 @@ class FbxModelLoader(plugin.AssetLoader):
                         bpy.data.materials.remove(material_slot.material)
                 bpy.data.meshes.remove(obj.data)
             elif obj.type == 'ARMATURE':
-                objects.extend(obj.children)
+                objects.extend(children_map.get(obj, []))
                 bpy.data.armatures.remove(obj.data)
             elif obj.type == 'CURVE':
                 bpy.data.curves.remove(obj.data)
             elif obj.type == 'EMPTY':
-                objects.extend(obj.children)
+                objects.extend(children_map.get(obj, []))
                 bpy.data.objects.remove(obj)
 
     def _process(self, libpath, asset_group, group_name, action):
@@ -90,24 +91,25 @@ class FbxModelLoader(plugin.AssetLoader):
             parent.objects.link(obj)
             collection.objects.unlink(obj)
 
+        prefix = f"{group_name}:"
+        # Data, materials and actions can be shared by several objects,
+        # collect them first so each one is renamed only once.
+        datablocks = {}
         for obj in objects:
-            name = obj.name
-            obj.name = f"{group_name}:{name}"
+            obj.name = prefix + obj.name
             if obj.type != 'EMPTY':
-                name_data = obj.data.name
-                obj.data.name = f"{group_name}:{name_data}"
+                datablocks[obj.data] = None
 
             if obj.type == 'MESH':
                 for material_slot in obj.material_slots:
-                    name_mat = material_slot.material.name
-                    material_slot.material.name = f"{group_name}:{name_mat}"
+                    if material_slot.material:
+                        datablocks[material_slot.material] = None
             elif obj.type == 'ARMATURE':
                 anim_data = obj.animation_data
                 if action is not None:
                     anim_data.action = action
                 elif anim_data.action is not None:
-                    name_action = anim_data.action.name
-                    anim_data.action.name = f"{group_name}:{name_action}"
+                    datablocks[anim_data.action] = None
 
             if not obj.get(AVALON_PROPERTY):
                 obj[AVALON_PROPERTY] = dict()
@@ -115,6 +117,9 @@ class FbxModelLoader(plugin.AssetLoader):
             avalon_info = obj[AVALON_PROPERTY]
             avalon_info.update({"container_name": group_name})
 
+        for datablock in datablocks:
+            datablock.name = prefix + datablock.name
+
         plugin.deselect_all()
 
         return objects
@@ -215,10 +220,10 @@ class FbxModelLoader(plugin.AssetLoader):
         group_libpath = metadata["libpath"]
 
         normalized_group_libpath = (
-            str(Path(bpy.path.abspath(group_libpath)).resolve())
+            plugin.normalize_libpath(group_libpath)
         )
         normalized_libpath = (
-            str(Path(bpy.path.abspath(str(libpath))).resolve())
+            plugin.normalize_libpath(str(libpath))
         )
         self.log.debug(
             "normalized_group_libpath:\n  %s\nnormalized_libpath:\n  %s",
@@ -35,6 +35,11 @@ class JsonLayoutLoader(plugin.AssetLoader):
 
     animation_creator_name = "CreateAnimation"
 
+    loader_names_by_family = {
+        "rig": "BlendRigLoader",
+        "model": "BlendModelLoader",
+    }
+
     def _remove(self, asset_group):
         objects = list(asset_group.children)
 
@@ -51,13 +56,8 @@ class JsonLayoutLoader(plugin.AssetLoader):
                     bpy.data.collections.remove(anim_collection)
 
     def _get_loader(self, loaders, family):
-        name = ""
-        if family == 'rig':
-            name = "BlendRigLoader"
-        elif family == 'model':
-            name = "BlendModelLoader"
-
-        if name == "":
+        name = self.loader_names_by_family.get(family)
+        if name is None:
             return None
 
         for loader in loaders:
@@ -73,12 +73,22 @@ class JsonLayoutLoader(plugin.AssetLoader):
             data = json.load(fp)
 
         all_loaders = discover_loader_plugins()
+        # Layouts usually place the same representation many times, so the
+        # loaders of each representation are only looked up once.
+        loaders_by_reference = {}
 
         for element in data:
             reference = element.get('reference')
             family = element.get('family')
+            # No need to look up the loaders of families that can't be
+            # loaded anyway.
+            if family not in self.loader_names_by_family:
+                continue
 
-            loaders = loaders_from_representation(all_loaders, reference)
+            loaders = loaders_by_reference.get(reference)
+            if loaders is None:
+                loaders = loaders_from_representation(all_loaders, reference)
+                loaders_by_reference[reference] = loaders
             loader = self._get_loader(loaders, family)
 
             if not loader:
@@ -220,10 +230,10 @@ class JsonLayoutLoader(plugin.AssetLoader):
         group_libpath = metadata["libpath"]
 
         normalized_group_libpath = (
-            str(Path(bpy.path.abspath(group_libpath)).resolve())
+            plugin.normalize_libpath(group_libpath)
         )
         normalized_libpath = (
-            str(Path(bpy.path.abspath(str(libpath))).resolve())
+            plugin.normalize_libpath(str(libpath))
         )
         self.log.debug(
             "normalized_group_libpath:\n  %s\nnormalized_libpath:\n  %s",
@@ -30,11 +30,13 @@ class BlendLookLoader(plugin.AssetLoader):
     icon = "code-fork"
     color = "orange"
 
-    def get_all_children(self, obj):
-        children = list(obj.children)
+    def get_all_children(self, obj, children_map=None):
+        if children_map is None:
+            children_map = plugin.get_children_map()
+        children = list(children_map.get(obj, []))
 
         for child in children:
-            children.extend(child.children)
+            children.extend(children_map.get(child, []))
 
         return children
 
@@ -68,8 +70,9 @@ class BlendLookLoader(plugin.AssetLoader):
 
             materials.append(material)
 
+            children_map = plugin.get_children_map()
             for obj in objects:
-                for child in self.get_all_children(obj):
+                for child in self.get_all_children(obj, children_map):
                     mesh_name = child.name.split(':')[0]
                     if mesh_name == material.name.split(':')[0]:
                         child.data.materials.clear()
@@ -169,10 +172,10 @@ class BlendLookLoader(plugin.AssetLoader):
         collection_libpath = collection_metadata["libpath"]
 
         normalized_collection_libpath = (
-            str(Path(bpy.path.abspath(collection_libpath)).resolve())
+            plugin.normalize_libpath(collection_libpath)
         )
         normalized_libpath = (
-            str(Path(bpy.path.abspath(str(libpath))).resolve())
+            plugin.normalize_libpath(str(libpath))
         )
         self.log.debug(
             "normalized_collection_libpath:\n  %s\nnormalized_libpath:\n  %s",
@@ -183,8 +186,9 @@ class BlendLookLoader(plugin.AssetLoader):
             self.log.info("Library already loaded, not updating...")
             return
 
+        children_map = plugin.get_children_map()
         for obj in collection_metadata['objects']:
-            for child in self.get_all_children(obj):
+            for child in self.get_all_children(obj, children_map):
                 child.data.materials.clear()
 
         for material in collection_metadata['materials']:
@@ -210,8 +214,9 @@ class BlendLookLoader(plugin.AssetLoader):
 
         collection_metadata = collection.get(AVALON_PROPERTY)
 
+        children_map = plugin.get_children_map()
         for obj in collection_metadata['objects']:
-            for child in self.get_all_children(obj):
+            for child in self.get_all_children(obj, children_map):
                 child.data.materials.clear()
 
         for material in collection_metadata['materials']:
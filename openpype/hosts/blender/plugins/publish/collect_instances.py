@@ -4,6 +4,7 @@ from typing import Generator
 import bpy
 
 import pyblish.api
+from openpype.hosts.blender.api import plugin
 from openpype.hosts.blender.api.pipeline import (
     AVALON_INSTANCES,
     AVALON_PROPERTY,
@@ -48,6 +49,9 @@ class CollectInstances(pyblish.api.ContextPlugin):
         """Collect the models from the current Blender scene."""
         asset_groups = self.get_asset_groups()
         collections = self.get_collections()
+        # `Object.children` scans all objects of the file, map the children
+        # of every object once for all instances.
+        children_map = plugin.get_children_map()
 
         for group in asset_groups:
             avalon_prop = group[AVALON_PROPERTY]
@@ -64,10 +68,10 @@ class CollectInstances(pyblish.api.ContextPlugin):
                 asset=asset,
                 task=task,
             )
-            objects = list(group.children)
+            objects = list(children_map.get(group, []))
             members = set()
             for obj in objects:
-                objects.extend(list(obj.children))
+                objects.extend(children_map.get(obj, []))
                 members.add(obj)
             members.add(group)
             instance[:] = list(members)
@@ -94,7 +98,7 @@ class CollectInstances(pyblish.api.ContextPlugin):
             if family == "animation":
                 for obj in collection.objects:
                     if obj.type == 'EMPTY' and obj.get(AVALON_PROPERTY):
-                        for child in obj.children:
+                        for child in children_map.get(obj, []):
                             if child.type == 'ARMATURE':
                                 members.append(child)
             members.append(collection)
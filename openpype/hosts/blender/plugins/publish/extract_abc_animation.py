@@ -33,9 +33,9 @@ class ExtractAnimationABC(publish.Extractor):
             if isinstance(obj, bpy.types.Collection):
                 for child in obj.all_objects:
                     objects.append(child)
+        children_map = plugin.get_children_map()
         for obj in objects:
-            children = [o for o in bpy.data.objects if o.parent == obj]
-            for child in children:
+            for child in children_map.get(obj, []):
                 objects.append(child)
 
         for obj in objects:
@@ -81,8 +81,7 @@ class ExtractAnimationFBX(publish.Extractor):
             do_clean=False
         )
 
-        for obj in bpy.data.objects:
-            obj.select_set(False)
+        plugin.deselect_all()
 
         asset_group.select_set(True)
         armature.select_set(True)
@@ -70,8 +70,7 @@ class ExtractLayout(publish.Extractor):
                 do_clean=False
             )
 
-            for o in bpy.data.objects:
-                o.select_set(False)
+            plugin.deselect_all()
 
             asset.select_set(True)
             obj.select_set(True)
@@ -32,8 +32,8 @@ class ValidateLookNoDefaultShaders(pyblish.api.InstancePlugin):
     label = 'Look No Default Shaders'
     actions = [openpype.hosts.maya.api.action.SelectInvalidAction]
 
-    DEFAULT_SHADERS = {"lambert1", "initialShadingGroup",
-                      "initialParticleSE", "particleCloud1"}
+    DEFAULT_SHADERS = frozenset({"lambert1", "initialShadingGroup",
+                                 "initialParticleSE", "particleCloud1"})
 
     def process(self, instance):
         """Process all the nodes in the instance"""
@@ -46,19 +46,31 @@ class ValidateLookNoDefaultShaders(pyblish.api.InstancePlugin):
     @classmethod
     def get_invalid(cls, instance):
 
+        nodes = list(instance)
+        if not nodes:
+            return []
+
+        # Query the shading engines of all nodes at once so the common case
+        # without any default shader connection needs only a single call
+        connected = set(
+            cmds.listConnections(nodes, type="shadingEngine") or []
+        )
+        if connected.isdisjoint(cls.DEFAULT_SHADERS):
+            return []
+
         invalid = set()
-        for node in instance:
+        for node in nodes:
             # Get shading engine connections
             shaders = cmds.listConnections(node, type="shadingEngine") or []
 
             # Check for any disallowed connections on *all* nodes
-            if any(s in cls.DEFAULT_SHADERS for s in shaders):
+            disallowed = cls.DEFAULT_SHADERS.intersection(shaders)
+            if disallowed:
 
                 # Explicitly log each individual "wrong" connection.
-                for s in shaders:
-                    if s in cls.DEFAULT_SHADERS:
-                        cls.log.error("Node has unallowed connection to "
-                                      "'{}': {}".format(s, node))
+                for s in disallowed:
+                    cls.log.error("Node has unallowed connection to "
+                                  "'{}': {}".format(s, node))
 
                 invalid.add(node)
 